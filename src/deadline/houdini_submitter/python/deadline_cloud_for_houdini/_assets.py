@@ -18,6 +18,7 @@ _IGNORE_REF_PARMS = (
     "RS_outputFileNamePrefix",
     "savetodirectory_directory",
 )
+_IGNORE_REF_PARMS_SET = frozenset(_IGNORE_REF_PARMS)
 
 
 def _get_hip_file() -> str:
@@ -74,12 +75,13 @@ def _get_asset_references(rop_node: hou.Node) -> AssetReferences:
     an AssetReferences object
     """
     asset_references = AssetReferences()
+    add_filename = asset_references.input_filenames.add
 
     for n in rop_node.parm("input_filenames").multiParmInstances():
         filepath = n.unexpandedString()
         filepath_glob = _houdini_time_vars_to_glob(filepath)
         if filepath == filepath_glob:
-            asset_references.input_filenames.add(n.eval())
+            add_filename(n.eval())
             continue
 
         evaluated_glob = _get_evaluated_glob_path(parm=n, globbed_path=filepath_glob)
@@ -87,17 +89,16 @@ def _get_asset_references(rop_node: hou.Node) -> AssetReferences:
         # scene introspection. It's possible that this will capture
         # extra files since a glob will not enforce numbers, but
         # handles well-defined file path patterns
-        for file in glob.iglob(evaluated_glob):
-            asset_references.input_filenames.add(file)
+        asset_references.input_filenames.update(glob.iglob(evaluated_glob))
 
     # Before we start properly evaluating directory paths, we should filter globbed
     # results by the pattern the variables expects to avoid an explosion of
     # of included input files
     asset_references.input_directories.update(
-        [n.eval() for n in rop_node.parm("input_directories").multiParmInstances()]
+        n.eval() for n in rop_node.parm("input_directories").multiParmInstances()
     )
     asset_references.output_directories.update(
-        [n.eval() for n in rop_node.parm("output_directories").multiParmInstances()]
+        n.eval() for n in rop_node.parm("output_directories").multiParmInstances()
     )
 
     return asset_references
@@ -110,16 +111,13 @@ def _get_saved_auto_detected_asset_references(rop_node: hou.Node) -> AssetRefere
     """
     saved_auto_refs = AssetReferences()
     saved_auto_refs.input_filenames.update(
-        [n.unexpandedString() for n in rop_node.parm("auto_input_filenames").multiParmInstances()]
+        n.unexpandedString() for n in rop_node.parm("auto_input_filenames").multiParmInstances()
     )
     saved_auto_refs.input_directories.update(
-        [n.unexpandedString() for n in rop_node.parm("auto_input_directories").multiParmInstances()]
+        n.unexpandedString() for n in rop_node.parm("auto_input_directories").multiParmInstances()
     )
     saved_auto_refs.output_directories.update(
-        [
-            n.unexpandedString()
-            for n in rop_node.parm("auto_output_directories").multiParmInstances()
-        ]
+        n.unexpandedString() for n in rop_node.parm("auto_output_directories").multiParmInstances()
     )
 
     return saved_auto_refs
@@ -144,13 +142,13 @@ def _parse_files(node: hou.Node):
     display_asset_refs.output_directories.difference_update(auto_asset_refs.output_directories)
     display_asset_refs.output_directories.difference_update(prev_auto_asset_refs.output_directories)
 
-    manual_input_filenames = sorted(list(display_asset_refs.input_filenames))
-    manual_input_directories = sorted(list(display_asset_refs.input_directories))
-    manual_output_directories = sorted(list(display_asset_refs.output_directories))
+    manual_input_filenames = sorted(display_asset_refs.input_filenames)
+    manual_input_directories = sorted(display_asset_refs.input_directories)
+    manual_output_directories = sorted(display_asset_refs.output_directories)
 
-    auto_detected_input_filenames = sorted(list(auto_asset_refs.input_filenames))
-    auto_detected_input_directories = sorted(list(auto_asset_refs.input_directories))
-    auto_detected_output_directories = sorted(list(auto_asset_refs.output_directories))
+    auto_detected_input_filenames = sorted(auto_asset_refs.input_filenames)
+    auto_detected_input_directories = sorted(auto_asset_refs.input_directories)
+    auto_detected_output_directories = sorted(auto_asset_refs.output_directories)
 
     new_display_input_filenames = manual_input_filenames + auto_detected_input_filenames
     new_display_input_directories = manual_input_directories + auto_detected_input_directories
@@ -170,11 +168,12 @@ def _update_paths_parm(node: hou.Node, parm_name: str, paths: list[str]):
     of paths passed in.
     """
     p = node.parm(parm_name)
-    while p.multiParmInstancesCount():
-        p.removeMultiParmInstance(0)
+    # Setting the count clears every instance at once, removing them one at a
+    # time shifts the remaining instances on each removal
+    p.set(0)
     p.set(len(paths))
-    for i, n in enumerate(p.multiParmInstances()):
-        n.set(paths[i])
+    for n, path in zip(p.multiParmInstances(), paths):
+        n.set(path)
 
 
 def _get_scene_asset_references(rop_node: hou.Node) -> AssetReferences:
@@ -182,12 +181,15 @@ def _get_scene_asset_references(rop_node: hou.Node) -> AssetReferences:
     asset_references = AssetReferences()
     asset_references.input_filenames.add(_get_hip_file())
 
+    add_filename = asset_references.input_filenames.add
+    add_directory = asset_references.input_directories.add
     for parm, ref in hou.fileReferences():
+        # check the reference string before making any calls into Houdini
         if (
             (not parm)
-            or (parm.node() == rop_node)
             or (ref.startswith(_IGNORE_REF_VALUES))
-            or (parm.name() in _IGNORE_REF_PARMS)
+            or (parm.name() in _IGNORE_REF_PARMS_SET)
+            or (parm.node() == rop_node)
         ):
             continue
 
@@ -195,11 +197,12 @@ def _get_scene_asset_references(rop_node: hou.Node) -> AssetReferences:
         # Check the evaluated version to ensure _something_ exists, but add
         # the unexpanded version to evaluate afterwards. Allows us to limit
         # files with parameters, such as $F, to one entry instead of possibly
-        # hundreds/thousands
-        if os.path.isdir(path):
-            asset_references.input_directories.add(parm.unexpandedString())
+        # hundreds/thousands. Most references are files, so only stat for a
+        # directory when the path is not a file.
         if os.path.isfile(path):
-            asset_references.input_filenames.add(parm.unexpandedString())
+            add_filename(parm.unexpandedString())
+        elif os.path.isdir(path):
+            add_directory(parm.unexpandedString())
 
     all_inputs = rop_node.inputAncestors()
     for node in all_inputs:
@@ -213,10 +216,8 @@ def _get_output_directories(node: hou.Node) -> set[str]:
     Find and return the set of all output directories detected from the passed
     in node.
     """
-    type_name = node.type().nameWithCategory()
-    out_parm = _NODE_DIR_MAP.get(type_name, None)
-
-    if not out_parm:
+    out_parm = _NODE_DIR_MAP.get(node.type().nameWithCategory())
+    if out_parm is None:
         return set()
 
     if not callable(out_parm):
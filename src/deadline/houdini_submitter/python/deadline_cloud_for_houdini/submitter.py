@@ -1,14 +1,16 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import copy
 from enum import Enum
 import os
+import re
 import sys
 import yaml
 import json
 from typing import Any, Dict
 from pathlib import Path
 
-from deadline.client.job_bundle._yaml import deadline_yaml_dump
+from deadline.client.job_bundle._yaml import DeadlineRepresenter, deadline_yaml_dump
 from deadline.client import api
 from deadline.client.job_bundle.submission import AssetReferences
 from deadline.client.job_bundle import create_job_history_bundle_dir
@@ -32,10 +34,49 @@ from ._version import version
 
 import hou
 
+# orjson parses noticeably faster when it is installed alongside the submitter
+try:
+    from orjson import loads as _json_loads  # type: ignore[import]
+except ImportError:
+    _json_loads = json.loads
+
 
 _NONE_SELECTED_TEXT = "<none selected>"
 _REFRESHING_TEXT = "<refreshing>"
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlSafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+if hasattr(yaml, "CSafeDumper"):
+
+    class _DeadlineCDumper(yaml.CSafeDumper):
+        """libyaml-backed equivalent of deadline_yaml_dump's DeadlineDumper"""
+
+    _DeadlineCDumper.add_representer(str, DeadlineRepresenter.represent_str)  # type: ignore[arg-type]
+
+    def _yaml_dump(data: Any) -> str:
+        return yaml.dump(
+            data,
+            Dumper=_DeadlineCDumper,
+            indent=1,
+            sort_keys=False,
+            default_flow_style=False,
+        )
+
+else:
+
+    def _yaml_dump(data: Any) -> str:
+        return deadline_yaml_dump(data, indent=1)
+
+
+_OVERRIDE_ENVIRONMENT_PATH = os.path.join(
+    os.path.dirname(__file__), "adaptor_override_environment.yaml"
+)
+# Ships with the package and is read only, so parse it once
+with open(_OVERRIDE_ENVIRONMENT_PATH) as _yaml_file:
+    _OVERRIDE_ENVIRONMENT = yaml.load(_yaml_file, Loader=_YamlLoader)
+
 
 class RenderStrategy(Enum):
     SEQUENTIAL = "SEQUENTIAL"
@@ -144,7 +185,25 @@ def _get_wedge_steps(rop: hou.Node):
     return wedged_steps
 
 
+# <<id>> [ <<dependencies>> ] <<node>> \t( <<frames>> )
+_ROP_STEP_RE = re.compile(r"^(\d+)\s+\[\s*([\d\s]*?)\s*\]\s+(\S+)\s*\t\(\s*([-\d\s]+?)\s*\)")
+
+# hscript render output per ROP path, cleared at the start of each submission
+_rop_steps_cache: dict[str, list[dict[str, Any]]] = {}
+
+
 def _get_rop_steps(rop: hou.Node):
+    """Return the steps for a ROP, reusing the hscript output already parsed for
+    it during the current submission
+    """
+    path = rop.path()
+    if path not in _rop_steps_cache:
+        _rop_steps_cache[path] = _parse_rop_steps(rop)
+    # callers rename and annotate the steps, so hand out copies
+    return [dict(step) for step in _rop_steps_cache[path]]
+
+
+def _parse_rop_steps(rop: hou.Node):
     """
     Parse hscript render command output to steps
     https://www.sidefx.com/docs/houdini/commands/render.html
@@ -159,35 +218,20 @@ def _get_rop_steps(rop: hou.Node):
     if err:
         raise Exception(f"hscript render: failed to list steps\n\n{str(err)}")
     rop_steps: list[dict[str, Any]] = []
-    for n in out.split("\n"):
-        if not n.strip():
+    for line in out.splitlines():
+        if not line.strip():
             continue
-        # two parts: rops and frame notation
-        parts = n.split("\t")
-        # id [ deps ] node
-        rop_str = parts[0]
-        # frames
-        frange_part = parts[1]
-        frange = frange_part.replace("( ", "")
-        frange = frange.replace(" )", "")
-        range_parts = frange.split(" ")
-        range_ints = [int(f) for f in range_parts]
+        m = _ROP_STEP_RE.match(line)
+        if m is None:
+            raise Exception(f"hscript render: unexpected step format\n\n{line}")
+        # id generated by hscript render, ids this depends on, full path to rop, frames
+        _id, deps_str, path, frames_str = m.groups()
+        deps = deps_str.split()
+        range_ints = [int(f) for f in frames_str.split()]
         # handle single frame
         if len(range_ints) == 1:
             frame = range_ints[0]
             range_ints = [frame, frame, 1]
-        rop_parts = rop_str.split(" ")
-        # first token is the int id generated by hscript render
-        _id = rop_parts[0]
-        # full path to rop
-        path = rop_parts[-2]
-        # section after id lists the dependencies between [ ]
-        deps: list[str] = []
-        for d in rop_parts[1:-2]:
-            if d in ["[", "]"]:
-                continue
-            # id this depends on
-            deps.append(d)
 
         node = hou.node(path)
 
@@ -209,11 +253,10 @@ def _get_rop_steps(rop: hou.Node):
         }
         rop_steps.append(step_dict)
     # expand full dependency names once the list is complete
-    id_steps = {n["id"]: n for n in rop_steps}
+    name_by_id = {n["id"]: n["name"] for n in rop_steps}
     for rop in rop_steps:
         if rop["dependency_ids"]:
-            names = [id_steps[n]["name"] for n in rop["dependency_ids"]]
-            rop["dependency_names"] = names
+            rop["dependency_names"] = [name_by_id[n] for n in rop["dependency_ids"]]
     return rop_steps
 
 
@@ -222,15 +265,14 @@ def _get_render_strategy_for_node(node: hou.Node) -> RenderStrategy:
     """Any changes to this function should be reflected in the user guide: /docs/user-guide.md"""
     render_strategy = RenderStrategy.PARALLEL
 
-    if (
-        node.type().nameWithCategory() == "Driver/geometry"
-        and node.parm("initsim")
-        and node.parm("initsim").eval()
-    ):
-        render_strategy = RenderStrategy.SEQUENTIAL
+    if node.type().nameWithCategory() == "Driver/geometry":
+        initsim_parm = node.parm("initsim")
+        if initsim_parm and initsim_parm.eval():
+            render_strategy = RenderStrategy.SEQUENTIAL
 
-    if node.parm("deadline_cloud_render_strategy"):
-        strategy_string = node.parm("deadline_cloud_render_strategy").evalAsString()
+    strategy_parm = node.parm("deadline_cloud_render_strategy")
+    if strategy_parm:
+        strategy_string = strategy_parm.evalAsString()
         if strategy_string.upper() == RenderStrategy.SEQUENTIAL.value:
             render_strategy = RenderStrategy.SEQUENTIAL
         elif strategy_string.upper() == RenderStrategy.PARALLEL.value:
@@ -243,10 +285,12 @@ def _get_render_strategy_for_node(node: hou.Node) -> RenderStrategy:
 
 
 def _get_parameter_values(node: hou.Node) -> dict[str, Any]:
-    priority = node.parm("priority").eval()
+    # evalParm looks up and evaluates a parm in a single call into Houdini
+    priority = node.evalParm("priority")
+    # menu parm, evaluate the token rather than the index
     initial_status = node.parm("initial_status").evalAsString()
-    failed_tasks_limit = node.parm("failed_tasks_limit").eval()
-    task_retry_limit = node.parm("task_retry_limit").eval()
+    failed_tasks_limit = node.evalParm("failed_tasks_limit")
+    task_retry_limit = node.evalParm("task_retry_limit")
     parameter_values = [
         {"name": "deadline:priority", "value": priority},
         {"name": "deadline:targetTaskRunStatus", "value": initial_status},
@@ -256,7 +300,7 @@ def _get_parameter_values(node: hou.Node) -> dict[str, Any]:
         *get_queue_parameter_values_as_openjd(node),
     ]
 
-    if node.parm("include_adaptor_wheels").eval():
+    if node.evalParm("include_adaptor_wheels"):
         parameter_values.append(
             {"name": "AdaptorWheels", "value": node.parm("adaptor_wheels").evalAsString()}
         )
@@ -300,13 +344,28 @@ def _unlock_node(rop_path: str) -> bool:
     return False
 
 
+# Last parsed queue parameter definitions, keyed by the JSON stored on the ROP
+_queue_parameter_definitions_cache: dict[str, list[dict[str, Any]]] = {}
+
+
+def _load_queue_parameter_definitions(definitions_json: str) -> list[dict[str, Any]]:
+    """Parse the queue parameter definitions JSON, reusing the previous result
+    when the ROP's user data has not changed
+    """
+    if definitions_json not in _queue_parameter_definitions_cache:
+        _queue_parameter_definitions_cache.clear()
+        _queue_parameter_definitions_cache[definitions_json] = _json_loads(definitions_json)
+    # callers append to the list, so hand out a copy
+    return list(_queue_parameter_definitions_cache[definitions_json])
+
+
 def _get_job_template(rop: hou.Node) -> dict[str, Any]:
     separate_steps = rop.parm("separate_steps").eval()
     rop_steps = _get_steps(rop, separate_steps)
     ignore_input_nodes = bool(separate_steps)
     queue_parameter_definitions_json = rop.userData("queue_parameter_definitions")
     parameter_definitions: list[dict[str, Any]] = (
-        json.loads(queue_parameter_definitions_json)
+        _load_queue_parameter_definitions(queue_parameter_definitions_json)
         if queue_parameter_definitions_json is not None
         else []
     )
@@ -319,9 +378,10 @@ def _get_job_template(rop: hou.Node) -> dict[str, Any]:
             "default": _get_hip_file(),
         }
     )
+    houdini_version = _get_houdini_version()
     steps: list[dict[str, Any]] = []
     for node in rop_steps:
-        steps.append(_get_step_template(node, ignore_input_nodes))
+        steps.append(_get_step_template(node, ignore_input_nodes, houdini_version))
     job_template = {
         "specificationVersion": "jobtemplate-2023-09",
         "name": rop.parm("name").evalAsString(),
@@ -337,26 +397,22 @@ def _get_job_template(rop: hou.Node) -> dict[str, Any]:
     if include_adaptor_wheels:
         adaptor_wheels = rop.parm("adaptor_wheels").evalAsString()
         if os.path.exists(adaptor_wheels):
-            override_file = os.path.join(
-                os.path.dirname(__file__), "adaptor_override_environment.yaml"
+            override_environment = copy.deepcopy(_OVERRIDE_ENVIRONMENT)
+            job_template["parameterDefinitions"].extend(
+                override_environment["parameterDefinitions"]
             )
-            with open(override_file) as yaml_file:
-                override_environment = yaml.safe_load(yaml_file)
-                job_template["parameterDefinitions"].extend(
-                    override_environment["parameterDefinitions"]
-                )
-                if "jobEnvironments" not in job_template:
-                    job_template["jobEnvironments"] = []
-                job_template["jobEnvironments"].append(override_environment["environment"])
+            if "jobEnvironments" not in job_template:
+                job_template["jobEnvironments"] = []
+            job_template["jobEnvironments"].append(override_environment["environment"])
 
     return job_template
 
 
-def _get_step_template(node: Dict, ignore_input_nodes: bool):
+def _get_step_template(node: Dict, ignore_input_nodes: bool, houdini_version: str):
     init_data = {
         "scene_file": "{{Param.HipFile}}",
         "render_node": node["rop"],
-        "version": _get_houdini_version(),
+        "version": houdini_version,
         "ignore_input_nodes": ignore_input_nodes,
         "wedgenum": node["wedgenum"],
         "wedge_node": node["wedge_node"],
@@ -366,7 +422,7 @@ def _get_step_template(node: Dict, ignore_input_nodes: bool):
         "filename": "init-data.yaml",
         "type": "TEXT",
         # Convert to dict to YAML string using the prettier nested object format
-        "data": yaml.safe_dump(init_data, default_flow_style=False),
+        "data": yaml.dump(init_data, Dumper=_YamlSafeDumper, default_flow_style=False),
     }
 
     environments = get_houdini_environments(init_data_attachment)
@@ -395,7 +451,7 @@ def _get_step_template(node: Dict, ignore_input_nodes: bool):
             "step": 1,
         }
 
-    task_data = yaml.safe_dump(task_data_dict, default_flow_style=False)
+    task_data = yaml.dump(task_data_dict, Dumper=_YamlSafeDumper, default_flow_style=False)
     # Remove single quotes around the frame parameter so it gets interpreted as a int and not a string
     task_data = task_data.replace("'{{Task.Param.Frame}}'", "{{Task.Param.Frame}}")
 
@@ -445,12 +501,15 @@ def _create_job_bundle(
     job_bundle_path = Path(job_bundle_dir)
     job_template = _get_job_template(rop_node)
     parameter_values = _get_parameter_values(rop_node)
-    with open(job_bundle_path / "template.yaml", "w", encoding="utf8") as f:
-        deadline_yaml_dump(job_template, f, indent=1)
-    with open(job_bundle_path / "parameter_values.yaml", "w", encoding="utf8") as f:
-        deadline_yaml_dump(parameter_values, f, indent=1)
-    with open(job_bundle_path / "asset_references.yaml", "w", encoding="utf8") as f:
-        deadline_yaml_dump(asset_references.to_dict(), f, indent=1)
+    # Emit each document to a string first so it reaches disk in one write
+    # instead of one per emitter event
+    (job_bundle_path / "template.yaml").write_text(_yaml_dump(job_template), encoding="utf8")
+    (job_bundle_path / "parameter_values.yaml").write_text(
+        _yaml_dump(parameter_values), encoding="utf8"
+    )
+    (job_bundle_path / "asset_references.yaml").write_text(
+        _yaml_dump(asset_references.to_dict()), encoding="utf8"
+    )
 
 
 def callback(kwargs):
@@ -466,6 +525,7 @@ def parse_files_callback(kwargs):
 
 def save_bundle_callback(kwargs):
     node = kwargs["node"]
+    _rop_steps_cache.clear()
     name = node.parm("name").evalAsString()
     asset_references = _get_asset_references(node)
     try:
@@ -488,6 +548,7 @@ def save_bundle_callback(kwargs):
 
 def submit_callback(kwargs):
     node = kwargs["node"]
+    _rop_steps_cache.clear()
     all_inputs = node.inputAncestors()
 
     if not all_inputs:
@@ -12,6 +12,7 @@ from deadline.houdini_submitter.python.deadline_cloud_for_houdini._assets import
     _get_output_directories,
     _houdini_time_vars_to_glob,
     _parse_files,
+    _update_paths_parm,
 )
 from deadline.client.job_bundle.submission import AssetReferences
 
@@ -64,6 +65,35 @@ def test_get_scene_asset_references():
     assert asset_refs.output_directories == set()
 
 
+def test_get_scene_asset_references_skips_isdir_for_files():
+    hou.hipFile.path.return_value = "/some/path/test.hip"
+    hou.node.inputAncestors.return_value = ()
+
+    file_parm = mock.Mock()
+    file_parm.name.return_value = "file"
+    file_parm.unexpandedString.return_value = "/path/asset.png"
+    file_parm.evalAsString.return_value = "/path/asset.png"
+    ignored_parm = mock.Mock()
+    ignored_parm.name.return_value = "soho_program"
+
+    hou.fileReferences.return_value = (
+        (file_parm, "/path/asset.png"),
+        (ignored_parm, "/path/soho.py"),
+    )
+    mock_os = mock.Mock()
+    mock_os.path.isfile.return_value = True
+
+    with mock.patch(
+        "deadline.houdini_submitter.python.deadline_cloud_for_houdini._assets.os", mock_os
+    ):
+        asset_refs = _get_scene_asset_references(hou.node)
+
+    assert asset_refs.input_filenames == {"/path/asset.png", "/some/path/test.hip"}
+    mock_os.path.isfile.assert_called_once_with("/path/asset.png")
+    mock_os.path.isdir.assert_not_called()
+    ignored_parm.evalAsString.assert_not_called()
+
+
 def test_get_output_directories():
     """
     Test that given a node, the type name and category are mapped correctly to
@@ -221,6 +251,23 @@ def test_parse_files_manually_added(
         assert mock_update_paths_parm.call_count == 6
 
 
+def test_update_paths_parm():
+    paths = ["/path/a.png", "/path/b.png"]
+    instances = [mock.Mock(), mock.Mock()]
+    parm = mock.Mock()
+    parm.multiParmInstances.return_value = instances
+    node = mock.Mock()
+    node.parm.return_value = parm
+
+    _update_paths_parm(node, "input_filenames", paths)
+
+    node.parm.assert_called_once_with("input_filenames")
+    parm.set.assert_has_calls([mock.call(0), mock.call(2)])
+    parm.removeMultiParmInstance.assert_not_called()
+    instances[0].set.assert_called_once_with("/path/a.png")
+    instances[1].set.assert_called_once_with("/path/b.png")
+
+
 @pytest.mark.parametrize(
     ("input", "expected"),
     [
@@ -1,9 +1,17 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import io
+import json
 from unittest.mock import Mock, patch
 import pytest
+from deadline.client.job_bundle._yaml import deadline_yaml_dump
+from deadline.client.job_bundle.submission import AssetReferences
 from deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter import (
+    _create_job_bundle,
     _get_job_template,
+    _get_parameter_values,
+    _load_queue_parameter_definitions,
+    _yaml_dump,
     RenderStrategy,
 )
 
@@ -190,3 +198,109 @@ def test_job_template_sequential_node(mock_get_steps, mock_parm):
         template["steps"][0]["script"]["embeddedFiles"][0]["data"]
         == "frame_range:\n  end: 5\n  start: 1\n  step: 1\nignore_input_nodes: true\nrender_node: /geo\n"
     )
+
+
+def test_yaml_dump_matches_deadline_yaml_dump():
+    data = {
+        "name": "My Job",
+        "data": "scene_file: '{{Param.HipFile}}'\nversion: 19.5.435\n",
+        "steps": [{"name": "/mantra-1", "range": "1-5:1", "enabled": True}],
+    }
+    expected = io.StringIO()
+    deadline_yaml_dump(data, expected, indent=1)
+
+    assert _yaml_dump(data) == expected.getvalue()
+
+
+def test_job_template_adaptor_wheels(mock_get_steps, tmp_path):
+    def mock_parm(name: str):
+        mock_name = Mock()
+        if name == "include_adaptor_wheels":
+            mock_name.eval.return_value = True
+        if name == "adaptor_wheels":
+            mock_name.evalAsString.return_value = str(tmp_path)
+        return mock_name
+
+    mock_node = Mock()
+    mock_node.userData.return_value = None
+    mock_node.parm = mock_parm
+    mock_get_steps.return_value = []
+
+    template = _get_job_template(mock_node)
+    template["jobEnvironments"][0]["name"] = "Modified"
+    template = _get_job_template(mock_node)
+
+    assert len(template["jobEnvironments"]) == 1
+    assert template["jobEnvironments"][0]["name"] != "Modified"
+    assert "AdaptorWheels" in [p["name"] for p in template["parameterDefinitions"]]
+
+
+def test_load_queue_parameter_definitions_is_cached():
+    definitions_json = '[{"name": "RezPackages", "type": "STRING"}]'
+
+    with patch(
+        "deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter._json_loads",
+        wraps=json.loads,
+    ) as mock_loads:
+        definitions = _load_queue_parameter_definitions(definitions_json)
+        definitions.append({"name": "HipFile"})
+        cached_definitions = _load_queue_parameter_definitions(definitions_json)
+
+    mock_loads.assert_called_once()
+    assert cached_definitions == [{"name": "RezPackages", "type": "STRING"}]
+
+
+def test_create_job_bundle(tmp_path):
+    job_template = {"name": "My Job", "steps": [{"name": "/mantra-1", "data": "a: 1\nb: 2\n"}]}
+    parameter_values = {"parameterValues": [{"name": "deadline:priority", "value": 50}]}
+    asset_references = AssetReferences(input_filenames={"/path/to/hip.hip"})
+
+    with (
+        patch(
+            "deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter._get_job_template",
+            Mock(return_value=job_template),
+        ),
+        patch(
+            "deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter._get_parameter_values",
+            Mock(return_value=parameter_values),
+        ),
+    ):
+        _create_job_bundle(Mock(), str(tmp_path), asset_references)
+
+    for filename, data in (
+        ("template.yaml", job_template),
+        ("parameter_values.yaml", parameter_values),
+        ("asset_references.yaml", asset_references.to_dict()),
+    ):
+        expected = io.StringIO()
+        deadline_yaml_dump(data, expected, indent=1)
+        assert (tmp_path / filename).read_text(encoding="utf8") == expected.getvalue()
+
+
+def test_get_parameter_values():
+    parm_values = {
+        "priority": 75,
+        "failed_tasks_limit": 20,
+        "task_retry_limit": 3,
+        "include_adaptor_wheels": 0,
+    }
+    mock_node = Mock()
+    mock_node.evalParm.side_effect = parm_values.__getitem__
+    mock_node.parm.return_value.evalAsString.return_value = "SUSPENDED"
+
+    with patch(
+        "deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter.get_queue_parameter_values_as_openjd",
+        Mock(return_value=[]),
+    ):
+        parameter_values = _get_parameter_values(mock_node)
+
+    mock_node.parm.assert_called_once_with("initial_status")
+    assert parameter_values == {
+        "parameterValues": [
+            {"name": "deadline:priority", "value": 75},
+            {"name": "deadline:targetTaskRunStatus", "value": "SUSPENDED"},
+            {"name": "deadline:maxFailedTasksCount", "value": 20},
+            {"name": "deadline:maxRetriesPerTask", "value": 3},
+            {"name": "HipFile", "value": "/path/to/hip.hip"},
+        ]
+    }
@@ -8,10 +8,19 @@ import pytest
 from deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter import (
     _get_render_strategy_for_node,
     _get_rop_steps,
+    _get_steps,
+    _rop_steps_cache,
     RenderStrategy,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_rop_steps_cache():
+    _rop_steps_cache.clear()
+    yield
+    _rop_steps_cache.clear()
+
+
 @patch("deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter.hou")
 def test_get_rop_steps(mock_hou):
     mock_hou.hscript.return_value = (
@@ -72,6 +81,80 @@ def test_get_rop_steps_simulation(mock_hou):
     assert steps[0]["render_strategy"] == RenderStrategy.SEQUENTIAL
 
 
+@pytest.mark.parametrize(
+    "line,expected_deps,expected_range",
+    [
+        ("1 [ ] /out/comp1 \t( 1 5 1 )", [], (1, 5, 1)),
+        ("1 [ 2 3 ] /out/comp1 \t( 1 5 1 )", ["2", "3"], (1, 5, 1)),
+        ("1 [ ] /out/mantra1 \t( 7 )", [], (7, 7, 1)),
+        ("1 [ ] /out/mantra1 \t( -10 10 2 )", [], (-10, 10, 2)),
+    ],
+)
+@patch("deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter.hou")
+def test_get_rop_steps_parses_line(mock_hou, line, expected_deps, expected_range):
+    mock_hou.hscript.return_value = (
+        f"2 [ ] /out/geo1 \t( 1 5 1 )\n3 [ ] /out/geo2 \t( 1 5 1 )\n{line}\n",
+        "",
+    )
+    node = mock_hou.node()
+    node.parm.return_value = None
+
+    steps = _get_rop_steps(node)
+
+    assert steps[2]["dependency_ids"] == expected_deps
+    assert (steps[2]["start"], steps[2]["end"], steps[2]["step"]) == expected_range
+
+
+@patch("deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter.hou")
+def test_get_rop_steps_raises_for_unexpected_output(mock_hou):
+    mock_hou.hscript.return_value = ("not a render step\n", "")
+
+    with pytest.raises(Exception, match="unexpected step format"):
+        _get_rop_steps(mock_hou.node())
+
+
+@patch("deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter.hou")
+def test_get_rop_steps_cached(mock_hou):
+    mock_hou.hscript.return_value = ("1 [ ] /out/mantra1 \t( 1 5 1 )\n", "")
+    node = mock_hou.node()
+    node.parm.return_value = None
+
+    steps = _get_rop_steps(node)
+    steps[0]["name"] = "renamed"
+    cached_steps = _get_rop_steps(node)
+
+    mock_hou.hscript.assert_called_once()
+    assert cached_steps[0]["name"] == "/out/mantra1-1"
+
+    _rop_steps_cache.clear()
+    _get_rop_steps(node)
+
+    assert mock_hou.hscript.call_count == 2
+
+
+@patch("deadline.houdini_submitter.python.deadline_cloud_for_houdini.submitter.hou")
+def test_get_steps_single_step_uses_hscript_range(mock_hou):
+    # the frame range hscript resolves for the connected node accounts for the
+    # deadline_cloud ROP's own range, strict input ranges and takes
+    mock_hou.hscript.return_value = (
+        "1 [ ] /out/geo1 \t( 1 10 1 )\n2 [ 1 ] /out/mantra1 \t( 5 8 1 )\n",
+        "",
+    )
+    mock_hou.node.return_value.parm.return_value = None
+    input_rop = Mock()
+    input_rop.type.return_value.name.return_value = "ifd"
+    node = Mock()
+    node.inputs.return_value = (input_rop,)
+
+    steps = _get_steps(node, separate_steps=0)
+
+    mock_hou.hscript.assert_called_once()
+    assert len(steps) == 1
+    assert steps[0]["name"] == "/out/mantra1"
+    assert "dependency_names" not in steps[0]
+    assert (steps[0]["start"], steps[0]["end"], steps[0]["step"]) == (5, 8, 1)
+
+
 @pytest.mark.parametrize(
     "category,initsim,override,expected_render_strategy",
     [
@@ -114,6 +197,15 @@ def test_get_render_strategy_for_node(
     assert _get_render_strategy_for_node(node) == expected_render_strategy
 
 
+def test_get_render_strategy_for_node_looks_up_parms_once():
+    node = Mock()
+    node.type.return_value.nameWithCategory.return_value = "Driver/ifd"
+    node.parm.return_value = None
+
+    assert _get_render_strategy_for_node(node) == RenderStrategy.PARALLEL
+    node.parm.assert_called_once_with("deadline_cloud_render_strategy")
+
+
 def test_get_render_strategy_for_node_raises_exception_for_invalid_strategy():
     node = Mock()
     node.parm.return_value.evalAsString.return_value = "not a valid strategy"